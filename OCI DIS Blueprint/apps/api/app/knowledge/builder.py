@@ -12,6 +12,7 @@ import json
 import math
 import os
 import re
+from copy import deepcopy
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
@@ -45,6 +46,8 @@ REPO_ROOT = _discover_repo_root(KNOWLEDGE_DIR)
 CURATED_PATH = KNOWLEDGE_DIR / "app_knowledge.yaml"
 DERIVED_PATH = KNOWLEDGE_DIR / "derived_app_knowledge.json"
 ROUTE_PARAMETER_PATTERN = re.compile(r"\[[^/]+\]|\{[^/]+\}")
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+ACCENT_FOLD_TABLE = str.maketrans("áéíóúñ", "aeioun")
 LOCAL_EMBEDDING_MODEL = "local-semantic-hash-v1"
 LOCAL_EMBEDDING_DIMENSIONS = 384
 RETRIEVAL_STOPWORDS = {
@@ -113,8 +116,27 @@ def _derive_routes(repo_root: Path) -> list[dict[str, str]]:
     return routes
 
 
+@lru_cache(maxsize=8)
+def _parse_yaml(path: Path, mtime_ns: int, size: int) -> object:
+    """Parse one YAML source, using the libyaml-backed loader when it is available.
+
+    ``mtime_ns`` and ``size`` only key the cache so an edited file is re-read.
+    """
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with path.open(encoding="utf-8") as handle:
+        return yaml.load(handle, Loader=loader)
+
+
+def _load_yaml(path: Path) -> object:
+    """Return a private copy of a parsed YAML source, reusing unchanged parses."""
+
+    stat = path.stat()
+    return deepcopy(_parse_yaml(path, stat.st_mtime_ns, stat.st_size))
+
+
 def _load_openapi(repo_root: Path) -> dict[str, Any]:
-    raw = yaml.safe_load((repo_root / "docs" / "api" / "openapi.yaml").read_text(encoding="utf-8"))
+    raw = _load_yaml(repo_root / "docs" / "api" / "openapi.yaml")
     return raw if isinstance(raw, dict) else {}
 
 
@@ -239,15 +261,7 @@ def _derive_entities(repo_root: Path) -> list[dict[str, str]]:
 
 
 def _normalized_embedding_text(value: object) -> str:
-    normalized = str(value).casefold()
-    return (
-        normalized.replace("á", "a")
-        .replace("é", "e")
-        .replace("í", "i")
-        .replace("ó", "o")
-        .replace("ú", "u")
-        .replace("ñ", "n")
-    )
+    return str(value).casefold().translate(ACCENT_FOLD_TABLE)
 
 
 def local_semantic_embedding(value: object) -> list[float]:
@@ -260,7 +274,7 @@ def local_semantic_embedding(value: object) -> list[float]:
 
     text = f"  {_normalized_embedding_text(value)}  "
     features = [text[index : index + 3] for index in range(max(0, len(text) - 2))]
-    words = re.findall(r"[a-z0-9]+", text)
+    words = TOKEN_PATTERN.findall(text)
     features.extend(f"w:{word}" for word in words)
     features.extend(f"b:{left}:{right}" for left, right in zip(words, words[1:]))
     vector = [0.0] * LOCAL_EMBEDDING_DIMENSIONS
@@ -288,7 +302,7 @@ def _retrieval_tokens(value: object) -> set[str]:
 
     return {
         token
-        for token in re.findall(r"[a-z0-9]+", _normalized_embedding_text(value))
+        for token in TOKEN_PATTERN.findall(_normalized_embedding_text(value))
         if len(token) > 1 and token not in RETRIEVAL_STOPWORDS
     }
 
@@ -463,7 +477,7 @@ def build_derived_manifest(repo_root: Path = REPO_ROOT) -> dict[str, object]:
 
 
 def _load_curated(curated_path: Path = CURATED_PATH) -> dict[str, object]:
-    document = yaml.safe_load(curated_path.read_text(encoding="utf-8"))
+    document = _load_yaml(curated_path)
     if not isinstance(document, dict) or not isinstance(document.get("sections"), list):
         raise KnowledgeValidationError("app_knowledge.yaml must contain a sections list")
     return document
@@ -478,20 +492,19 @@ def load_curated_knowledge(curated_path: Path = CURATED_PATH) -> dict[str, objec
 def load_derived_manifest(derived_path: Path = DERIVED_PATH) -> dict[str, object]:
     """Load a validated runtime vector artifact or the packaged contract."""
 
-    selected_path = derived_path
+    document = json.loads(derived_path.read_text(encoding="utf-8"))
     runtime_value = os.getenv("APP_KNOWLEDGE_RUNTIME_PATH", "").strip()
     if derived_path == DERIVED_PATH and runtime_value:
         runtime_path = Path(runtime_value)
         if runtime_path.is_file():
-            packaged = json.loads(DERIVED_PATH.read_text(encoding="utf-8"))
+            # Each artifact is parsed once; the runtime copy replaces the packaged one in place.
             runtime = json.loads(runtime_path.read_text(encoding="utf-8"))
             if (
-                isinstance(packaged, dict)
+                isinstance(document, dict)
                 and isinstance(runtime, dict)
-                and runtime.get("source_hash") == packaged.get("source_hash")
+                and runtime.get("source_hash") == document.get("source_hash")
             ):
-                selected_path = runtime_path
-    document = json.loads(selected_path.read_text(encoding="utf-8"))
+                document = runtime
     if not isinstance(document, dict):
         raise KnowledgeValidationError("derived_app_knowledge.json must contain an object")
     return document
@@ -518,7 +518,8 @@ async def import_rate_card(
             status_code=422,
             detail={"detail": "Rate card must be uploaded as CSV", "error_code": "RATE_CARD_FORMAT_INVALID"},
         )
-    contents = await file.read()
+    # One byte past the limit is enough for the service to reject an oversized upload.
+    contents = await file.read(pricing_service.MAX_RATE_CARD_BYTES + 1)
     try:
         async with db.begin():
             return await pricing_service.import_rate_card(
@@ -98,6 +98,17 @@ UNSUPPORTED_EVIDENCE_DISCLAIMER_PATTERN = re.compile(
     r")\b",
     re.IGNORECASE,
 )
+SENTENCE_BOUNDARY_PATTERN = re.compile(r"(?<=[.!?])(?:\s+|\n+)")
+BLANK_LINE_RUN_PATTERN = re.compile(r"\n{3,}")
+INLINE_WHITESPACE_PATTERN = re.compile(r"[ \t]+")
+BOLD_ASTERISK_PATTERN = re.compile(r"\*\*(.+?)\*\*")
+BOLD_UNDERSCORE_PATTERN = re.compile(r"__(.+?)__")
+MARKDOWN_HEADING_PATTERN = re.compile(r"(?m)^#{1,6}\s+")
+BULLET_MARKER_PATTERN = re.compile(r"(?m)^\s*[-*]\s+")
+DANGLING_NUMBERED_MARKER_PATTERN = re.compile(r"(?m)^(\s*\d+[.)])\s*\n+\s*(?=\S)")
+DANGLING_BULLET_MARKER_PATTERN = re.compile(r"(?m)^(\s*[-•])\s*\n+\s*(?=\S)")
+ANSWER_LABEL_LINE_PATTERN = re.compile(r"(?im)^\s*(?:\*{0,2})?(?:respuesta|answer)(?:\*{0,2})?\s*\n+")
+SO_PREFIX_PATTERN = re.compile(r"(?i)^\s*so:\s*")
 
 
 @dataclass(frozen=True)
@@ -147,7 +158,7 @@ def _canonical_support_next_action(value: str, evidence: dict[str, object]) -> s
     if not label or not href.startswith("/"):
         return value
     without_provider_action = SUPPORT_NEXT_ACTION_LINE_PATTERN.sub("", value)
-    without_provider_action = re.sub(r"\n{3,}", "\n\n", without_provider_action).strip()
+    without_provider_action = BLANK_LINE_RUN_PATTERN.sub("\n\n", without_provider_action).strip()
     prefix = "Siguiente paso" if evidence.get("response_language") == "es" else "Next action"
     action = f"**{prefix}:** [{label}]({href})"
     return f"{without_provider_action}\n\n{action}" if without_provider_action else action
@@ -203,15 +214,15 @@ def normalize_agent_summary(value: str | None, *, preserve_markdown: bool = Fals
         return ""
     normalized = value.replace("\r", "").strip()
     if not preserve_markdown:
-        normalized = re.sub(r"\*\*(.+?)\*\*", r"\1", normalized)
-        normalized = re.sub(r"__(.+?)__", r"\1", normalized)
+        normalized = BOLD_ASTERISK_PATTERN.sub(r"\1", normalized)
+        normalized = BOLD_UNDERSCORE_PATTERN.sub(r"\1", normalized)
         normalized = normalized.replace("`", "")
-        normalized = re.sub(r"(?m)^#{1,6}\s+", "", normalized)
-    normalized = re.sub(r"(?m)^\s*[-*]\s+", "- ", normalized)
-    normalized = re.sub(r"(?m)^(\s*\d+[.)])\s*\n+\s*(?=\S)", r"\1 ", normalized)
-    normalized = re.sub(r"(?m)^(\s*[-•])\s*\n+\s*(?=\S)", r"\1 ", normalized)
-    normalized = re.sub(r"[ \t]+", " ", normalized)
-    normalized = re.sub(r"\n{3,}", "\n\n", normalized)
+        normalized = MARKDOWN_HEADING_PATTERN.sub("", normalized)
+    normalized = BULLET_MARKER_PATTERN.sub("- ", normalized)
+    normalized = DANGLING_NUMBERED_MARKER_PATTERN.sub(r"\1 ", normalized)
+    normalized = DANGLING_BULLET_MARKER_PATTERN.sub(r"\1 ", normalized)
+    normalized = INLINE_WHITESPACE_PATTERN.sub(" ", normalized)
+    normalized = BLANK_LINE_RUN_PATTERN.sub("\n\n", normalized)
     return normalized.strip()
 
 
@@ -243,16 +254,11 @@ def _remove_support_meta_reasoning(value: str) -> str:
         heading = FINAL_ANSWER_HEADING_PATTERN.search(value)
         if heading is not None:
             value = value[heading.start() :]
-    value = re.sub(
-        r"(?im)^\s*(?:\*{0,2})?(?:respuesta|answer)(?:\*{0,2})?\s*\n+",
-        "",
-        value,
-        count=1,
-    )
-    sentences = re.split(r"(?<=[.!?])(?:\s+|\n+)", value.strip())
+    value = ANSWER_LABEL_LINE_PATTERN.sub("", value, count=1)
+    sentences = SENTENCE_BOUNDARY_PATTERN.split(value.strip())
     visible = []
     for sentence in sentences:
-        cleaned = re.sub(r"(?i)^\s*so:\s*", "", sentence).strip()
+        cleaned = SO_PREFIX_PATTERN.sub("", sentence).strip()
         if cleaned and not META_REASONING_PATTERN.search(cleaned):
             visible.append(cleaned)
     return "\n\n".join(visible).strip()
@@ -261,7 +267,7 @@ def _remove_support_meta_reasoning(value: str) -> str:
 def _remove_support_internal_placeholder_sentences(value: str) -> str:
     """Drop redacted model sentences without discarding an otherwise useful answer."""
 
-    sentences = re.split(r"(?<=[.!?])(?:\s+|\n+)", value.strip())
+    sentences = SENTENCE_BOUNDARY_PATTERN.split(value.strip())
     return "\n\n".join(
         sentence.strip()
         for sentence in sentences
@@ -279,7 +285,7 @@ def _remove_ungrounded_external_workarounds(
     assessment = _dict(knowledge.get("capability_assessment"))
     if assessment.get("status") != "not_documented":
         return value
-    sentences = re.split(r"(?<=[.!?])(?:\s+|\n+)", value.strip())
+    sentences = SENTENCE_BOUNDARY_PATTERN.split(value.strip())
     retained = [
         sentence.strip()
         for sentence in sentences
@@ -313,22 +319,40 @@ SENSITIVE_NUMBER_UNIT_PATTERN = re.compile(
     r"^\s*(?:seconds?|minutes?|hours?|days?|segundos?|minutos?|horas?|d[ií]as?)\b",
     re.IGNORECASE,
 )
+NUMBER_SPACING_PATTERN = re.compile(r"[\s\u00a0\u202f]")
+DECIMAL_COMMA_PATTERN = re.compile(r"\d+,\d{1,2}")
+DOTTED_THOUSANDS_PATTERN = re.compile(r"[1-9]\d{0,2}(?:\.\d{3})+")
+NON_DIGIT_PATTERN = re.compile(r"[^0-9]")
+COMMERCIAL_GRAIN_TERM_PATTERN = re.compile(
+    r"\b(commercial|comercial|pricing|precio|ready|release|liberaci[oó]n)\b",
+    re.IGNORECASE,
+)
+ZERO_ATTENTION_PHRASE_PATTERN = re.compile(
+    r"\b(ningun[ao]?|ninguna|ninguno|no hay).{0,45}"
+    r"(atenci[oó]n|revisi[oó]n|revisar|qa)\b",
+    re.IGNORECASE,
+)
+BLOCKED_QA_PHRASE_PATTERN = re.compile(
+    r"\b(qa\s+rojo|estado\s+qa\s*=\s*bloqueado)\b",
+    re.IGNORECASE,
+)
+APP_REFERENCE_PATTERN = re.compile(r"\boci\s+dis\b|\barchitect\b|\bapp\b")
 
 
 def _scaled_number(raw: str, suffix: str = "") -> float | None:
     try:
-        compact = re.sub(r"[\s\u00a0\u202f]", "", raw)
+        compact = NUMBER_SPACING_PATTERN.sub("", raw)
         if "." in compact and "," in compact:
             if compact.rfind(",") > compact.rfind("."):
                 compact = compact.replace(".", "").replace(",", ".")
             else:
                 compact = compact.replace(",", "")
         elif "," in compact:
-            if re.fullmatch(r"\d+,\d{1,2}", compact):
+            if DECIMAL_COMMA_PATTERN.fullmatch(compact):
                 compact = compact.replace(",", ".")
             else:
                 compact = compact.replace(",", "")
-        elif re.fullmatch(r"[1-9]\d{0,2}(?:\.\d{3})+", compact):
+        elif DOTTED_THOUSANDS_PATTERN.fullmatch(compact):
             compact = compact.replace(".", "")
         value = float(compact)
     except ValueError:
@@ -366,7 +390,7 @@ def _numbers_are_grounded(summary: str, evidence: dict[str, object]) -> bool:
     evidence_numbers = _evidence_numbers(sanitize_for_json(evidence))
     for match in SUMMARY_NUMBER_PATTERN.finditer(summary):
         prefix, raw, suffix, percent = match.groups()
-        digits = re.sub(r"[^0-9]", "", raw)
+        digits = NON_DIGIT_PATTERN.sub("", raw)
         high_risk = bool(
             "$" in prefix
             or "usd" in prefix.casefold()
@@ -404,11 +428,7 @@ def _support_evidence_grain_failure(
     project = _dict(evidence.get("project"))
     qa_distribution = _dict(project.get("qa_distribution"))
     commercial_coverage = _dict(project.get("commercial_coverage"))
-    if re.search(
-        r"\b(commercial|comercial|pricing|precio|ready|release|liberaci[oó]n)\b",
-        summary,
-        re.IGNORECASE,
-    ):
+    if COMMERCIAL_GRAIN_TERM_PATTERN.search(summary):
         return "evidence_grain_mismatch"
     allowed_counts = {
         _number(project.get("integration_count")),
@@ -448,20 +468,9 @@ def _support_evidence_grain_failure(
     if attention_count == 0:
         has_zero_attention = (
             0.0 in summary_numbers
-            or bool(
-                re.search(
-                    r"\b(ningun[ao]?|ninguna|ninguno|no hay).{0,45}"
-                    r"(atenci[oó]n|revisi[oó]n|revisar|qa)\b",
-                    summary,
-                    re.IGNORECASE,
-                )
-            )
+            or bool(ZERO_ATTENTION_PHRASE_PATTERN.search(summary))
         )
-        if not has_zero_attention or re.search(
-            r"\b(qa\s+rojo|estado\s+qa\s*=\s*bloqueado)\b",
-            summary,
-            re.IGNORECASE,
-        ):
+        if not has_zero_attention or BLOCKED_QA_PHRASE_PATTERN.search(summary):
             return "evidence_grain_mismatch"
     elif attention_count not in summary_numbers:
         return "evidence_grain_mismatch"
@@ -524,7 +533,7 @@ def _grounding_failure(
             return knowledge_failure
         question = _text(evidence.get("current_question")).casefold()
         answer = normalized_summary.casefold()
-        if "oci dis" in question and not re.search(r"\boci\s+dis\b|\barchitect\b|\bapp\b", answer):
+        if "oci dis" in question and not APP_REFERENCE_PATTERN.search(answer):
             return "answer_not_relevant"
     if definition.type == "service_verification":
         sources_checked = evidence.get("sources_checked")
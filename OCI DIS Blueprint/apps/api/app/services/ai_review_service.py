@@ -1000,12 +1000,18 @@ def _topology_insights(
 
     system_rows: dict[str, list[CatalogIntegration]] = {}
     edge_rows: dict[tuple[str, str], list[CatalogIntegration]] = {}
+    edge_warning_counts: Counter[tuple[str, str]] = Counter()
+    edge_revisar_counts: Counter[tuple[str, str]] = Counter()
     for row in rows:
         source = row.source_system or "Unknown source"
         destination = row.destination_system or "Unknown destination"
         system_rows.setdefault(source, []).append(row)
         system_rows.setdefault(destination, []).append(row)
         edge_rows.setdefault((source, destination), []).append(row)
+        if row.id in warning_map:
+            edge_warning_counts[(source, destination)] += 1
+        if (row.qa_status or "").upper() == "REVISAR":
+            edge_revisar_counts[(source, destination)] += 1
 
     insights: list[AiReviewTopologyInsight] = []
     top_system, top_system_rows = max(system_rows.items(), key=lambda item: len(item[1]))
@@ -1034,16 +1040,12 @@ def _topology_insights(
     edge_candidates = [
         (edge, edge_scope)
         for edge, edge_scope in edge_rows.items()
-        if any((row.qa_status or "").upper() == "REVISAR" or row.id in warning_map for row in edge_scope)
+        if edge_warning_counts[edge] or edge_revisar_counts[edge]
     ]
     if edge_candidates:
         (source, destination), risky_edge_rows = max(
             edge_candidates,
-            key=lambda item: (
-                sum(1 for row in item[1] if row.id in warning_map),
-                sum(1 for row in item[1] if (row.qa_status or "").upper() == "REVISAR"),
-                len(item[1]),
-            ),
+            key=lambda item: (edge_warning_counts[item[0]], edge_revisar_counts[item[0]], len(item[1])),
         )
         insights.append(
             AiReviewTopologyInsight(
@@ -1053,7 +1055,7 @@ def _topology_insights(
                 title=f"{source} -> {destination} concentrates review risk",
                 summary=(
                     f"{len(risky_edge_rows)} integration(s) share this route; "
-                    f"{sum(1 for row in risky_edge_rows if row.id in warning_map)} have service-warning evidence."
+                    f"{edge_warning_counts[(source, destination)]} have service-warning evidence."
                 ),
                 metric=f"{len(risky_edge_rows)} route rows",
                 source_system=source,
@@ -137,6 +137,11 @@ class GovernedSkuCommercialContract:
 
 
 UNRESOLVED_BOM_LINE_STATUSES = {"blocked", "rate_card_required", "input_required"}
+DEFAULT_SERVICE_SETTINGS: dict[str, dict[str, object]] = {
+    "OIC3": {"edition": "standard", "instance_count": 1},
+    "DATA_INTEGRATION": {"workspace_count": 1, "operator_execution_hours_month": 0},
+    "GOLDENGATE": {"ocpu_count": 1},
+}
 
 
 def _now() -> datetime:
@@ -1318,20 +1323,10 @@ def _default_service_config(
     licensing_model: str = "license_included",
     byol_gated_service_ids: AbstractSet[str] = frozenset(),
 ) -> dict[str, dict[str, object]]:
-    service_config: dict[str, dict[str, object]] = {}
-    for service_id in service_ids:
-        if service_id == "OIC3":
-            service_config[service_id] = {"edition": "standard", "instance_count": 1}
-        elif service_id == "DATA_INTEGRATION":
-            service_config[service_id] = {"workspace_count": 1, "operator_execution_hours_month": 0}
-        elif service_id == "STREAMING":
-            service_config[service_id] = {}
-        elif service_id == "QUEUE":
-            service_config[service_id] = {}
-        elif service_id == "GOLDENGATE":
-            service_config[service_id] = {"ocpu_count": 1}
-        else:
-            service_config[service_id] = {}
+    service_config = {
+        service_id: dict(DEFAULT_SERVICE_SETTINGS.get(service_id, {}))
+        for service_id in service_ids
+    }
     return _apply_licensing_model(
         service_config,
         licensing_model,
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from dataclasses import asdict, dataclass, replace
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from io import BytesIO
 from os import PathLike
 import re
@@ -29,6 +30,27 @@ WorkbookSource: TypeAlias = str | PathLike[str] | BinaryIO | BytesIO
 
 _PART_NUMBER_PATTERN = re.compile(r"^[A-Z]\d{4,}[A-Z0-9-]*$")
 _NUMERIC_PATTERN = re.compile(r"^[+-]?(?:\d+(?:\.\d*)?|\.\d+)$")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_NON_ALNUM_PATTERN = re.compile(r"[^a-z0-9]+")
+_ALNUM_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_REGION_CODE_PATTERN = re.compile(r"[a-z]{3}-[a-z0-9-]+")
+_LABEL_QUALIFIER_SUFFIX_PATTERN = re.compile(r"\s*\((?:priced in advance of availability|continued)\)\s*$")
+_FOOTNOTE_SUFFIX_PATTERN = re.compile(r"(?:\s*\(?(?:note|footnote)\s*\d+\)?\s*)+$")
+_IDENTITY_STOPWORDS = frozenset(
+    {
+        "and",
+        "as",
+        "cloud",
+        "for",
+        "in",
+        "of",
+        "on",
+        "oracle",
+        "service",
+        "services",
+        "the",
+    }
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -670,8 +692,8 @@ def _category_from_row(row: tuple[Cell, ...], header: dict[str, int]) -> str | N
 
 def _canonical_price(records: list[CommercialWorkbookRecord]) -> CommercialWorkbookRecord:
     ordered = _deduplicated_records(records)
-    canonical = sorted(ordered, key=lambda record: (-_price_score(record), _evidence_key(record)))[0]
-    identity = sorted(ordered, key=_identity_rank)[0]
+    canonical = min(ordered, key=lambda record: (-_price_score(record), _evidence_key(record)))
+    identity = min(ordered, key=_identity_rank)
     terms = _deduplicated_price_terms(ordered)
     evidence = tuple(item for record in ordered for item in record.source_evidence)
     return replace(
@@ -696,8 +718,8 @@ def _canonical_price(records: list[CommercialWorkbookRecord]) -> CommercialWorkb
 
 def _canonical_supplement(records: list[CommercialWorkbookRecord]) -> CommercialWorkbookRecord:
     ordered = _deduplicated_records(records)
-    canonical = sorted(ordered, key=lambda record: (-_supplement_score(record), _evidence_key(record)))[0]
-    identity = sorted(ordered, key=_identity_rank)[0]
+    canonical = min(ordered, key=lambda record: (-_supplement_score(record), _evidence_key(record)))
+    identity = min(ordered, key=_identity_rank)
     evidence = tuple(item for record in ordered for item in record.source_evidence)
     return replace(
         canonical,
@@ -781,18 +803,19 @@ def _deduplicated_product_paths(
     return tuple(sorted(paths, key=lambda path: (len(path), path)))
 
 
+@lru_cache(maxsize=4096)
 def _semantic_text(value: str | None) -> str | None:
-    """Normalize source prose for conflict comparison without changing evidence."""
+    """Normalize source prose for conflict comparison without changing evidence.
+
+    Metric and price-term labels repeat across thousands of workbook rows, so
+    results are memoized.
+    """
 
     if not value or not value.strip() or value.strip() == "-":
         return None
-    normalized = re.sub(r"\s+", " ", value).strip().casefold()
-    normalized = re.sub(
-        r"\s*\((?:priced in advance of availability|continued)\)\s*$",
-        "",
-        normalized,
-    )
-    return re.sub(r"(?:\s*\(?(?:note|footnote)\s*\d+\)?\s*)+$", "", normalized)
+    normalized = _WHITESPACE_PATTERN.sub(" ", value).strip().casefold()
+    normalized = _LABEL_QUALIFIER_SUFFIX_PATTERN.sub("", normalized)
+    return _FOOTNOTE_SUFFIX_PATTERN.sub("", normalized)
 
 
 def _valid_metric_identity(value: str) -> bool:
@@ -801,7 +824,7 @@ def _valid_metric_identity(value: str) -> bool:
         return False
     if normalized in {"metric", "not applicable.", "not applicable", "n/a"}:
         return False
-    if normalized.startswith("country zone") or re.fullmatch(r"[a-z]{3}-[a-z0-9-]+", normalized):
+    if normalized.startswith("country zone") or _REGION_CODE_PATTERN.fullmatch(normalized):
         return False
     return True
 
@@ -1042,23 +1065,10 @@ def _identity_rank(record: CommercialWorkbookRecord) -> tuple[object, ...]:
 def _identity_tokens(value: str | None) -> set[str]:
     """Return stable product-identity tokens without workbook footnote noise."""
 
-    ignored = {
-        "and",
-        "as",
-        "cloud",
-        "for",
-        "in",
-        "of",
-        "on",
-        "oracle",
-        "service",
-        "services",
-        "the",
-    }
     return {
         token
-        for token in re.findall(r"[a-z0-9]+", _header_text(value))
-        if len(token) > 1 and token not in ignored
+        for token in _ALNUM_TOKEN_PATTERN.findall(_header_text(value))
+        if len(token) > 1 and token not in _IDENTITY_STOPWORDS
     }
 
 
@@ -1133,7 +1143,7 @@ def _header_text(value: object) -> str:
     text = _clean_text(value)
     if text is None:
         return ""
-    return re.sub(r"[^a-z0-9]+", " ", text.casefold()).strip()
+    return _NON_ALNUM_PATTERN.sub(" ", text.casefold()).strip()
 
 
 def _clean_text(value: object) -> str | None:
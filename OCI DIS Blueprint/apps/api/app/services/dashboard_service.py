@@ -301,10 +301,11 @@ def _enrich_product_footprint(
             )
         )
 
-    verified_count = sum(item.resolution_status == "verified_product" for item in products)
-    included_count = sum(item.resolution_status == "included_or_dependent" for item in products)
-    external_count = sum(item.resolution_status == "external_dependency" for item in products)
-    selection_count = sum(item.resolution_status == "product_selection_required" for item in products)
+    resolution_counts: Counter[str] = Counter(item.resolution_status for item in products)
+    verified_count = resolution_counts["verified_product"]
+    included_count = resolution_counts["included_or_dependent"]
+    external_count = resolution_counts["external_dependency"]
+    selection_count = resolution_counts["product_selection_required"]
     return footprint.model_copy(
         update={
             "captured_product_count": len(products),
@@ -362,10 +363,11 @@ def _build_charts(
         fan_out=_coverage_metric(fan_out_complete, total),
     )
 
+    qa_counts: Counter[str | None] = Counter(row.qa_status for row in rows)
     completeness = CompletenessChart(
-        qa_ok=sum(1 for row in rows if row.qa_status == "OK"),
-        qa_revisar=sum(1 for row in rows if row.qa_status == "REVISAR"),
-        qa_pending=sum(1 for row in rows if row.qa_status == "PENDING"),
+        qa_ok=qa_counts["OK"],
+        qa_revisar=qa_counts["REVISAR"],
+        qa_pending=qa_counts["PENDING"],
         rationale_informed=sum(1 for row in rows if _has_text(row.pattern_rationale)),
         core_tools_informed=sum(1 for row in rows if _has_text(row.core_tools)),
         comments_informed=sum(1 for row in rows if _has_text(row.comments)),
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import tempfile
 from datetime import datetime, timezone
+from io import BytesIO
 from pathlib import Path
 from typing import Any, cast
 from uuid import uuid4
@@ -32,15 +33,9 @@ from app.services.serializers import sanitize_for_json
 
 
 EXPORT_ROOT = Path(tempfile.gettempdir()) / "oci-dis-exports"
-FILES_DIR = EXPORT_ROOT / "files"
 JOBS_DIR = EXPORT_ROOT / "jobs"
 
 
-def _ensure_export_dirs() -> None:
-    FILES_DIR.mkdir(parents=True, exist_ok=True)
-    JOBS_DIR.mkdir(parents=True, exist_ok=True)
-
-
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
@@ -96,10 +91,6 @@ def _job_file(job_id: str) -> Path:
     return JOBS_DIR / f"{job_id}.json"
 
 
-def _file_path(job_id: str, extension: str) -> Path:
-    return FILES_DIR / f"{job_id}.{extension}"
-
-
 def _artifact_key(project_id: str, job_id: str, extension: str) -> str:
     return f"exports/{project_id}/files/{job_id}.{extension}"
 
@@ -139,10 +130,10 @@ async def _build_job(
     snapshot_id: str,
     export_format: str,
     filename: str,
-    file_path: Path,
+    contents: bytes,
 ) -> ExportJobResponse:
     created_at = _utc_now()
-    job_id = file_path.stem
+    job_id = str(uuid4())
     job = ExportJobResponse(
         job_id=job_id,
         project_id=project_id,
@@ -153,13 +144,11 @@ async def _build_job(
         download_url=f"/api/v1/exports/{project_id}/jobs/{job_id}/download",
         created_at=created_at,
     )
-    extension = file_path.suffix.lstrip(".")
     file_reference = storage_service.put_bytes(
-        _artifact_key(project_id, job_id, extension),
-        file_path.read_bytes(),
+        _artifact_key(project_id, job_id, export_format),
+        contents,
         metadata={"project-id": project_id, "snapshot-id": snapshot_id},
     )
-    file_path.unlink(missing_ok=True)
     _write_job_metadata(job, file_reference)
     return job
 
@@ -198,7 +187,7 @@ def _pattern_support_payload(pattern_ids: list[str]) -> dict[str, object]:
     }
 
 
-def _render_basic_pdf(lines: list[str], file_path: Path) -> None:
+def _render_basic_pdf(lines: list[str]) -> bytes:
     sanitized = [line[:110] for line in lines]
     content_parts = ["BT", "/F1 12 Tf", "50 790 Td"]
     for index, line in enumerate(sanitized):
@@ -238,7 +227,7 @@ def _render_basic_pdf(lines: list[str], file_path: Path) -> None:
             f"startxref\n{xref_offset}\n%%EOF"
         ).encode("ascii")
     )
-    file_path.write_bytes(pdf)
+    return bytes(pdf)
 
 
 async def create_xlsx_export(
@@ -355,16 +344,14 @@ async def create_xlsx_export(
     else:
         support_sheet.append(["—", "No assigned patterns", "—", "—", "—", "—", "—", "—", "—", "—", "This export does not include any selected pattern IDs."])
 
-    _ensure_export_dirs()
-    job_id = str(uuid4())
-    file_path = _file_path(job_id, "xlsx")
-    workbook.save(file_path)
+    buffer = BytesIO()
+    workbook.save(buffer)
     return await _build_job(
         project_id=project_id,
         snapshot_id=snapshot_id,
         export_format="xlsx",
         filename=f"{project_id}-{snapshot_id}.xlsx",
-        file_path=file_path,
+        contents=buffer.getvalue(),
     )
 
 
@@ -400,16 +387,12 @@ async def create_json_export(
         }
     )
 
-    _ensure_export_dirs()
-    job_id = str(uuid4())
-    file_path = _file_path(job_id, "json")
-    file_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
     return await _build_job(
         project_id=project_id,
         snapshot_id=snapshot_id,
         export_format="json",
         filename=f"{project_id}-{snapshot_id}.json",
-        file_path=file_path,
+        contents=json.dumps(payload, indent=2).encode("utf-8"),
     )
 
 
@@ -457,16 +440,12 @@ async def create_pdf_export(
     for risk in dashboard_snapshot.risks[:5]:
         lines.append(f"Risk {risk.label}: {risk.count}")
 
-    _ensure_export_dirs()
-    job_id = str(uuid4())
-    file_path = _file_path(job_id, "pdf")
-    _render_basic_pdf(lines, file_path)
     return await _build_job(
         project_id=project_id,
         snapshot_id=snapshot_id,
         export_format="pdf",
         filename=f"{project_id}-{snapshot_id}.pdf",
-        file_path=file_path,
+        contents=_render_basic_pdf(lines),
     )
 
 
@@ -677,16 +656,12 @@ async def create_brief_export(project_id: str, db: AsyncSession) -> ExportJobRes
         ]
     )
 
-    _ensure_export_dirs()
-    job_id = str(uuid4())
-    file_path = _file_path(job_id, "md")
-    file_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
     return await _build_job(
         project_id=project_id,
         snapshot_id=snapshot_id,
         export_format="md",
         filename=f"{project_id}-{snapshot_id}-executive-brief.md",
-        file_path=file_path,
+        contents=("\n".join(lines) + "\n").encode("utf-8"),
     )
 
 
@@ -826,16 +801,14 @@ async def create_bom_xlsx_export(
             width = min(max(len(str(cell.value or "")) for cell in column_cells) + 2, 60)
             sheet.column_dimensions[column_cells[0].column_letter].width = width
 
-    _ensure_export_dirs()
-    job_id = str(uuid4())
-    file_path = _file_path(job_id, "xlsx")
-    workbook.save(file_path)
+    buffer = BytesIO()
+    workbook.save(buffer)
     return await _build_job(
         project_id=project_id,
         snapshot_id=bom_snapshot_id,
         export_format="xlsx",
         filename=f"{project_id}-{bom_snapshot_id}-oci-bom.xlsx",
-        file_path=file_path,
+        contents=buffer.getvalue(),
     )
 
 
@@ -869,16 +842,12 @@ async def create_bom_json_export(
             "exported_at": _utc_now(),
         }
     )
-    _ensure_export_dirs()
-    job_id = str(uuid4())
-    file_path = _file_path(job_id, "json")
-    file_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
     return await _build_job(
         project_id=project_id,
         snapshot_id=bom_snapshot_id,
         export_format="json",
         filename=f"{project_id}-{bom_snapshot_id}-oci-bom.json",
-        file_path=file_path,
+        contents=json.dumps(payload, indent=2).encode("utf-8"),
     )
 
 
@@ -919,16 +888,12 @@ async def create_bom_pdf_export(
             f"{amount_label} | {item.status}"
         )
     lines.extend(["", "Planning estimate only; not an Oracle quote."])
-    _ensure_export_dirs()
-    job_id = str(uuid4())
-    file_path = _file_path(job_id, "pdf")
-    _render_basic_pdf(lines, file_path)
     return await _build_job(
         project_id=project_id,
         snapshot_id=bom_snapshot_id,
         export_format="pdf",
         filename=f"{project_id}-{bom_snapshot_id}-oci-bom.pdf",
-        file_path=file_path,
+        contents=_render_basic_pdf(lines),
     )
 
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import hashlib
 import json
 import re
+from functools import lru_cache
 from typing import Any
 
 from pydantic import TypeAdapter, ValidationError
@@ -580,6 +581,13 @@ def _candidate_is_grounded(candidate: object, focused_row: dict[str, object]) ->
     return False
 
 
+@lru_cache(maxsize=None)
+def _manual_field_adapter(field: str) -> TypeAdapter[Any]:
+    """Build the validator for one manual-capture field once per process."""
+
+    return TypeAdapter(ManualIntegrationCreate.model_fields[field].annotation)
+
+
 def _decode_agent_json(candidate_summary: str) -> dict[str, object] | None:
     """Decode one JSON object while tolerating bounded provider prose wrappers."""
 
@@ -692,9 +700,8 @@ def parse_agent_correction(
                 f"Provide source evidence for the proposed '{field}' value before mapping it."
             )
             continue
-        annotation = ManualIntegrationCreate.model_fields[str(field)].annotation
         try:
-            validated: object = TypeAdapter(annotation).validate_python(cleaned)
+            validated: object = _manual_field_adapter(str(field)).validate_python(cleaned)
         except ValidationError:
             rejected_patch_fields.append(str(field))
             required_decisions.append(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from datetime import datetime, timezone
 from typing import Any, cast
 
@@ -395,6 +396,7 @@ async def _summary(session_id: str, db: AsyncSession) -> ExternalCaptureSummary:
         ).all()
     )
     serialized_rows = [_serialize_draft(row) for row in rows]
+    status_counts = Counter(row.status for row in rows)
     return ExternalCaptureSummary(
         total=len(rows),
         schema_ready=sum(
@@ -409,10 +411,10 @@ async def _summary(session_id: str, db: AsyncSession) -> ExternalCaptureSummary:
             for row in rows
             if _has_pattern_change(row)
         ),
-        needs_review=sum(1 for row in rows if row.status == "needs_review"),
-        approved=sum(1 for row in rows if row.status == "approved"),
-        rejected=sum(1 for row in rows if row.status == "rejected"),
-        promoted=sum(1 for row in rows if row.status == "promoted"),
+        needs_review=status_counts["needs_review"],
+        approved=status_counts["approved"],
+        rejected=status_counts["rejected"],
+        promoted=status_counts["promoted"],
         analyses_current=sum(
             1
             for row in serialized_rows
@@ -29,7 +29,7 @@ LOGGER = structlog.get_logger(__name__)
 RETRYABLE_STATUS_CODES = frozenset({408, 409, 425, 429, 500, 502, 503, 504})
 RESPONSES_UNSUPPORTED_STATUS_CODES = frozenset({404, 405})
 OCI_EMBED_TEXT_MAX_INPUTS = 95
-_RESPONSES_CAPABILITY_CACHE: dict[str, tuple[bool, float]] = {}
+_RESPONSES_CAPABILITY_CACHE: dict[tuple[str, str, str], tuple[bool, float]] = {}
 
 PROMPT_REDACTION_POLICY = [
     "email addresses",
@@ -122,7 +122,7 @@ class NormalizedToolCall:
     arguments: dict[str, object]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OciGenAiRuntimeConfig:
     """Resolved non-secret OCI Generative AI API-key configuration."""
 
@@ -341,10 +341,13 @@ async def generate_embeddings(
         )
 
 
-def _capability_cache_key(runtime: OciGenAiRuntimeConfig, settings: Settings) -> str:
+def _capability_cache_key(
+    runtime: OciGenAiRuntimeConfig,
+    settings: Settings,
+) -> tuple[str, str, str]:
     """Return a non-secret cache key for one OCI Responses capability scope."""
 
-    return f"{_responses_url(runtime)}|{runtime.model_id}|{settings.OCI_GENAI_PROJECT_ID.strip()}"
+    return (_responses_url(runtime), runtime.model_id, settings.OCI_GENAI_PROJECT_ID.strip())
 
 
 def _cached_responses_capability(
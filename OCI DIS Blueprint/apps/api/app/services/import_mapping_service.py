@@ -251,9 +251,12 @@ def validate_contract_update(
         raise ValueError(f"Answer required mapping guidance before approval: {', '.join(missing)}.")
 
     payload_questions = [item for item in questions if str(item.get("id", "")).startswith("payload:")]
+    fields_by_index: dict[str, dict[str, object]] = {}
+    for item in updated_fields:
+        fields_by_index.setdefault(str(item["source_index"]), item)
     for question in payload_questions:
         index = str(question["id"]).split(":", 1)[1]
-        field = next((item for item in updated_fields if str(item["source_index"]) == index), None)
+        field = fields_by_index.get(index)
         if field and answers.get(str(question["id"])) not in {None, "", "per_operation"}:
             field["target_field"] = EVIDENCE_ONLY
 
@@ -7,10 +7,15 @@ from decimal import Decimal
 from enum import Enum
 from typing import Optional
 
+# Exact types only: str/int subclasses such as StrEnum still need coercion below.
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
 
 def sanitize_for_json(value: object) -> object:
     """Convert values into JSON-safe primitives."""
 
+    if type(value) in _JSON_SCALAR_TYPES:
+        return value
     if isinstance(value, dict):
         return {str(key): sanitize_for_json(item) for key, item in value.items()}
     if isinstance(value, list):
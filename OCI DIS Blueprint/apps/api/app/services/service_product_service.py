@@ -5,13 +5,14 @@ from __future__ import annotations
 from collections import defaultdict
 from datetime import UTC, datetime
 import hashlib
+from operator import attrgetter
 import re
 from typing import Iterable, cast
 from urllib.parse import urlparse
 
 from fastapi import HTTPException
 import httpx
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import (
@@ -54,6 +55,9 @@ EVIDENCE_FETCH_TIMEOUT_SECONDS = 12.0
 EVIDENCE_USER_AGENT = "OCI-DIS-Blueprint-Service-Verification/1.0"
 CLAIM_PARSER_VERSION = "oracle_http_claim_parser_v2"
 TERMINAL_JOB_STATUSES = {"completed", "failed"}
+_RULE_SORT_KEY = attrgetter("source_service_id", "target_service_id", "relationship_type")
+_SCRIPT_BLOCK_PATTERN = re.compile(r"<(script|style).*?</\1>", re.IGNORECASE | re.DOTALL)
+_HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
 
 
 def _now_utc() -> datetime:
@@ -98,9 +102,9 @@ def _is_allowed_evidence_url(url: str) -> bool:
 
 
 def _normalize_evidence_text(content: str) -> str:
-    without_scripts = re.sub(r"<(script|style).*?</\1>", " ", content, flags=re.IGNORECASE | re.DOTALL)
-    without_tags = re.sub(r"<[^>]+>", " ", without_scripts)
-    return re.sub(r"\s+", " ", without_tags).strip()
+    without_scripts = _SCRIPT_BLOCK_PATTERN.sub(" ", content)
+    without_tags = _HTML_TAG_PATTERN.sub(" ", without_scripts)
+    return " ".join(without_tags.split())
 
 
 def _content_hash(text: str) -> str:
@@ -692,7 +696,7 @@ async def get_service_product(service_id: str, db: AsyncSession) -> ServiceProdu
             detail={"detail": "Service product not found", "error_code": "SERVICE_PRODUCT_NOT_FOUND"},
         )
     commercial_policy = await db.scalar(select(ServiceCommercialPolicy).where(ServiceCommercialPolicy.service_id == profile.service_id, ServiceCommercialPolicy.status == "approved"))
-    approved_mapping_count = len(list((await db.scalars(select(ServiceProductSkuMapping).where(ServiceProductSkuMapping.service_id == profile.service_id, ServiceProductSkuMapping.status == "approved"))).all()))
+    approved_mapping_count = int(await db.scalar(select(func.count()).select_from(ServiceProductSkuMapping).where(ServiceProductSkuMapping.service_id == profile.service_id, ServiceProductSkuMapping.status == "approved")) or 0)
     summary = serialize_service_summary(
         profile,
         limits_by_profile.get(profile.id, []),
@@ -763,17 +767,16 @@ async def get_interoperability_matrix(db: AsyncSession) -> ServiceInteroperabili
         )
         for profile in profiles
     ]
-    seen_rule_ids: set[str] = set()
-    serialized_rules: list[ServiceInteroperabilityRuleResponse] = []
-    for rules in rules_by_profile.values():
-        for rule in rules:
-            if rule.id in seen_rule_ids:
-                continue
-            if rule.source_service_profile_id not in profiles_by_id or rule.target_service_profile_id not in profiles_by_id:
-                continue
-            serialized_rules.append(serialize_interoperability_rule(rule, profiles_by_id))
-            seen_rule_ids.add(rule.id)
-    serialized_rules.sort(key=lambda rule: (rule.source_service_id, rule.target_service_id, rule.relationship_type))
+    unique_rules = {
+        rule.id: rule
+        for rules in rules_by_profile.values()
+        for rule in rules
+        if rule.source_service_profile_id in profiles_by_id and rule.target_service_profile_id in profiles_by_id
+    }
+    serialized_rules = sorted(
+        (serialize_interoperability_rule(rule, profiles_by_id) for rule in unique_rules.values()),
+        key=_RULE_SORT_KEY,
+    )
     return ServiceInteroperabilityMatrixResponse(
         services=summaries,
         rules=serialized_rules,
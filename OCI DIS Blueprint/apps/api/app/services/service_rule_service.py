@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, fields
 from datetime import datetime
+from functools import cached_property
 from hashlib import sha256
 import json
 from types import MappingProxyType
@@ -96,6 +97,15 @@ class ServiceRuleBundle:
             return frozenset()
         return frozenset(str(item).strip().upper() for item in value if str(item).strip())
 
+    @cached_property
+    def _relationships_by_pair(self) -> Mapping[tuple[str, str], GovernedRelationship]:
+        """Index directional relationships once; canvas evaluation queries them per route."""
+
+        index: dict[tuple[str, str], GovernedRelationship] = {}
+        for relationship in self.relationships:
+            index.setdefault((relationship.source_service_id, relationship.target_service_id), relationship)
+        return MappingProxyType(index)
+
     def targets_for(self, source_service_id: str) -> frozenset[str]:
         """Return supported targets for one source service."""
 
@@ -108,15 +118,7 @@ class ServiceRuleBundle:
     def relationship(self, source_service_id: str, target_service_id: str) -> GovernedRelationship | None:
         """Return one governed directional relationship when present."""
 
-        return next(
-            (
-                relationship
-                for relationship in self.relationships
-                if relationship.source_service_id == source_service_id
-                and relationship.target_service_id == target_service_id
-            ),
-            None,
-        )
+        return self._relationships_by_pair.get((source_service_id, target_service_id))
 
     def metadata(self) -> dict[str, object]:
         """Serialize provenance for immutable snapshots and downstream evidence."""
@@ -7,15 +7,15 @@ import mimetypes
 import re
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import boto3
-from botocore.client import BaseClient
-from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.core.config import get_settings
 
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+
 
 _S3_SCHEME = "s3://"
 _SAFE_NAME = re.compile(r"[^A-Za-z0-9._-]+")
@@ -30,6 +30,10 @@ def safe_filename(value: str) -> str:
 
 @lru_cache(maxsize=1)
 def _client() -> BaseClient:
+    # boto3 dominates import time; load it only once storage is first used.
+    import boto3
+    from botocore.config import Config
+
     settings = get_settings()
     return boto3.client(
         "s3",
@@ -6,6 +6,7 @@ from collections import defaultdict
 from dataclasses import replace
 from decimal import Decimal, InvalidOperation
 import json
+from operator import attrgetter
 
 from fastapi import HTTPException
 from sqlalchemy import select
@@ -365,10 +366,7 @@ def select_node_mappings(
         if mapping.selection_policy == "required"
         and mapping.billing_metric_key not in selected_metric_keys
     ]
-    return sorted(
-        [*required, *selected],
-        key=lambda mapping: (mapping.billing_metric_key, mapping.id),
-    )
+    return sorted([*required, *selected], key=attrgetter("billing_metric_key", "id"))
 
 
 async def _selected_scenario_mapping_ids(
@@ -19,6 +19,7 @@ from app.services import ai_review_service, genai_client
 from app.services.genai_client import (
     _build_prompt,
     _normalize_summary,
+    _redact_sensitive_text,
     _resolved_oci_config,
     _response_text,
     _token_usage,
@@ -937,3 +938,21 @@ def test_oci_prompt_redacts_sensitive_values() -> None:
     assert "[REDACTED]" in payload
     assert "Never introduce a new fact, number, service, SKU, finding, risk, recommendation, action" in prompt[0]["content"]
     assert "US English" in prompt[0]["content"]
+
+
+@pytest.mark.parametrize(
+    ("text", "secret", "expected"),
+    [
+        ("Owner jane.doe@example.com approved.", "jane.doe@example.com", "Owner [REDACTED] approved."),
+        ("Header Bearer abcdef1234567890xyz", "abcdef1234567890xyz", "Header [REDACTED]"),
+        ("Use password = hunter22 locally.", "hunter22", "Use [REDACTED] locally."),
+        ("Key AbCdEf0123456789AbCdEf0123456789zz rotated.", "AbCdEf0123456789AbCdEf0123456789zz", "Key [REDACTED] rotated."),
+        ("OIC Gen3 handles 5,000 messages per hour.", None, "OIC Gen3 handles 5,000 messages per hour."),
+    ],
+)
+def test_sensitive_text_redaction_patterns(text: str, secret: str | None, expected: str) -> None:
+    redacted = _redact_sensitive_text(text)
+
+    assert redacted == expected
+    if secret is not None:
+        assert secret not in redacted
@@ -1132,6 +1132,31 @@ async def test_contract_rate_card_import_is_admin_only_and_idempotent(api_client
     assert second.json()["id"] == first.json()["id"]
 
 
+@pytest.mark.asyncio
+async def test_contract_rate_card_import_rejects_oversized_upload(
+    api_client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(pricing_service, "MAX_RATE_CARD_BYTES", 64)
+    received_sizes: list[int] = []
+    normalize_rate_card_csv = pricing_service.normalize_rate_card_csv
+
+    def recording_normalize(contents: bytes, currency: str) -> list[dict[str, object]]:
+        received_sizes.append(len(contents))
+        return normalize_rate_card_csv(contents, currency)
+
+    monkeypatch.setattr(pricing_service, "normalize_rate_card_csv", recording_normalize)
+    response = await api_client.post(
+        "/api/v1/pricing/rate-card-imports",
+        data={"name": "Customer agreement", "currency": "USD"},
+        files={"file": ("customer-rate-card.csv", b"Part Number,Net Unit Price\n" + b"B89639,0.50\n" * 32, "text/csv")},
+        headers={"X-Actor-Role": "Admin", "X-Actor-Id": "pricing-admin"},
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"]["error_code"] == "RATE_CARD_CONTENT_INVALID"
+    assert received_sizes == [pricing_service.MAX_RATE_CARD_BYTES + 1]
+
+
 @pytest.mark.asyncio
 async def test_scenario_rejects_unbalanced_environment_shares(
     api_client: AsyncClient,
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 
+import pytest
 from openpyxl import load_workbook
 
 from app.core.calc_engine import composition_issues
@@ -57,30 +58,38 @@ def test_synthetic_workbook_uses_the_governed_official_template_contract(tmp_pat
     assert parsed.loaded_count == len(dataset.import_rows)
 
 
-def test_synthetic_queue_routes_stay_within_governed_message_limit() -> None:
-    for spec in (synthetic_service.DEFAULT_SYNTHETIC_SPEC, synthetic_service.SMOKE_SYNTHETIC_SPEC):
-        dataset = synthetic_service.generate_synthetic_dataset(spec)
-        queue_rows = [
-            row
-            for row in [*dataset.import_rows, *dataset.manual_rows]
-            if "OCI Queue" in row.core_tools
-        ]
-
-        assert queue_rows
-        assert max(row.payload_per_execution_kb for row in queue_rows) <= synthetic_service.SYNTHETIC_QUEUE_MAX_MESSAGE_KB
-
-
-def test_synthetic_streaming_routes_stay_within_governed_message_limit() -> None:
-    for spec in (synthetic_service.DEFAULT_SYNTHETIC_SPEC, synthetic_service.SMOKE_SYNTHETIC_SPEC):
-        dataset = synthetic_service.generate_synthetic_dataset(spec)
-        streaming_rows = [
-            row
-            for row in [*dataset.import_rows, *dataset.manual_rows]
-            if "OCI Streaming" in row.core_tools
-        ]
-
-        assert streaming_rows
-        assert max(row.payload_per_execution_kb for row in streaming_rows) <= synthetic_service.SYNTHETIC_STREAMING_MAX_MESSAGE_KB
+@pytest.mark.parametrize(
+    "spec",
+    [synthetic_service.DEFAULT_SYNTHETIC_SPEC, synthetic_service.SMOKE_SYNTHETIC_SPEC],
+    ids=["default", "smoke"],
+)
+def test_synthetic_queue_routes_stay_within_governed_message_limit(spec: synthetic_service.SyntheticProjectSpec) -> None:
+    dataset = synthetic_service.generate_synthetic_dataset(spec)
+    queue_rows = [
+        row
+        for row in [*dataset.import_rows, *dataset.manual_rows]
+        if "OCI Queue" in row.core_tools
+    ]
+
+    assert queue_rows
+    assert max(row.payload_per_execution_kb for row in queue_rows) <= synthetic_service.SYNTHETIC_QUEUE_MAX_MESSAGE_KB
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [synthetic_service.DEFAULT_SYNTHETIC_SPEC, synthetic_service.SMOKE_SYNTHETIC_SPEC],
+    ids=["default", "smoke"],
+)
+def test_synthetic_streaming_routes_stay_within_governed_message_limit(spec: synthetic_service.SyntheticProjectSpec) -> None:
+    dataset = synthetic_service.generate_synthetic_dataset(spec)
+    streaming_rows = [
+        row
+        for row in [*dataset.import_rows, *dataset.manual_rows]
+        if "OCI Streaming" in row.core_tools
+    ]
+
+    assert streaming_rows
+    assert max(row.payload_per_execution_kb for row in streaming_rows) <= synthetic_service.SYNTHETIC_STREAMING_MAX_MESSAGE_KB
 
 
 def test_canvas_state_is_compact_and_parseable_shape() -> None:
@@ -6,12 +6,13 @@ Returns structured reasons so the UI can drill down.
 """
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 from .pattern_certification import composition_issues, get_pattern_certification
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QAResult:
     status: str          # "OK" | "REVISAR"
     reasons: list[str]   # structured reason codes for REVISAR
@@ -45,7 +46,10 @@ VALID_PATTERN_IDS = {
 }
 
 
+@lru_cache(maxsize=256)
 def normalize_trigger_type(trigger_type: Optional[str]) -> Optional[str]:
+    # Called once per catalog row from QA, dashboards and import; the raw
+    # trigger vocabulary is small, so memoizing skips repeated normalization.
     if not trigger_type or trigger_type.strip() == "":
         return None
     normalized = VALID_TRIGGER_TYPES.get(_normalize_trigger_key(trigger_type))
@@ -113,7 +113,7 @@ def normalize_payload_to_kb(payload_value: float, unit: PayloadUnit) -> CalcResu
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CalcResult:
     value: Optional[float]
     unit: str
@@ -123,7 +123,7 @@ class CalcResult:
     assumption_keys: list[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IntegrationInput:
     """Minimal input slice needed for volumetry — sourced from CatalogIntegration."""
     integration_id: str
@@ -1,5 +1,7 @@
 """Focused QA-engine tests for workbook trigger semantics and activation rules."""
 
+import pytest
+
 from ..engine.qa import evaluate_qa, normalize_trigger_type
 
 
@@ -38,19 +40,19 @@ def test_inactive_row_stays_outside_qa() -> None:
     assert result.reasons == []
 
 
-def test_workbook_trigger_vocabulary_is_accepted() -> None:
-    for trigger in ["REST Trigger", "SOAP Trigger", "Event Trigger", "Scheduled"]:
-        result = evaluate_qa(
-            interface_id="INT-001",
-            trigger_type=trigger,
-            selected_pattern="#02",
-            pattern_rationale="Sufficient workbook-aligned rationale.",
-            core_tools="OIC Gen3",
-            payload_per_execution_kb=100.0,
-            is_fan_out=False,
-            fan_out_targets=None,
-        )
-        assert "INVALID_TRIGGER_TYPE" not in result.reasons
+@pytest.mark.parametrize("trigger", ["REST Trigger", "SOAP Trigger", "Event Trigger", "Scheduled"])
+def test_workbook_trigger_vocabulary_is_accepted(trigger: str) -> None:
+    result = evaluate_qa(
+        interface_id="INT-001",
+        trigger_type=trigger,
+        selected_pattern="#02",
+        pattern_rationale="Sufficient workbook-aligned rationale.",
+        core_tools="OIC Gen3",
+        payload_per_execution_kb=100.0,
+        is_fan_out=False,
+        fan_out_targets=None,
+    )
+    assert "INVALID_TRIGGER_TYPE" not in result.reasons
 
 
 def test_unknown_trigger_text_remains_invalid() -> None: